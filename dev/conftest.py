@@ -1,40 +1,41 @@
 # noinspection PyPackageRequirements
 import pytest as pt
-import os
-import shutil as sh
 import kegg_pull.kegg_url as ku
 
+_ORGANISM_SET = frozenset(('organism-code', 'organism-T-number'))
 
-@pt.fixture(autouse=True)
-def mock_organism_set(mocker, request):
-    if 'disable_mock_organism_set' not in request.keywords:
-        organism_set_mock = {'organism-code', 'organism-T-number'}
-        mocker.patch.object(ku.AbstractKEGGurl, 'organism_set', organism_set_mock)
+
+@pt.fixture(autouse=True, scope='session')
+def mock_organism_set():
+    with pt.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(ku.AbstractKEGGurl, '_organism_set', _ORGANISM_SET)
+        yield
+
+
+@pt.fixture(name='unmocked_organism_set')
+def disable_mock_organism_set(monkeypatch):
+    monkeypatch.setattr(ku.AbstractKEGGurl, '_organism_set', None)
+
+
+@pt.fixture(name='in_tmp_path')
+def change_to_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
 
 
 @pt.fixture(name='output_file', params=['dir/subdir/file.txt', 'dir/file.txt', './file.txt', 'file.txt'])
-def get_output_file(request):
-    output_file: str = request.param
-    yield output_file
-    os.remove(output_file)
-    sh.rmtree('dir', ignore_errors=True)
+def get_output_file(request, in_tmp_path):
+    yield request.param
 
 
 @pt.fixture(name='zip_archive_data', params=['file.txt', 'dir/file.txt', '/file.txt', '/dir/file.txt'])
-def get_zip_archive_data(request):
+def get_zip_archive_data(request, tmp_path):
     zip_file_name: str = request.param
-    zip_archive_path = 'archive.zip'
+    zip_archive_path = str(tmp_path / 'archive.zip')
     yield zip_archive_path, zip_file_name
-    os.remove(zip_archive_path)
 
 
 @pt.fixture(name='json_file_path', params=[
     'dir/subdir/file.json', 'dir/file.json', './file.json', 'file.json', 'archive.zip:file.json', 'archive.zip:dir/file.json'])
-def get_json_file_path(request):
-    json_file_path: str = request.param
-    yield json_file_path
-    if '.zip:' in json_file_path:
-        os.remove('archive.zip')
-    else:
-        os.remove(json_file_path)
-    sh.rmtree('dir', ignore_errors=True)
+def get_json_file_path(request, in_tmp_path):
+    yield request.param
@@ -7,8 +7,8 @@ entry_ids_mock = ['a', 'b']
 expected_output: str = '\n'.join(entry_ids_mock)
 
 
-def test_help(mocker):
-    u.assert_help(mocker=mocker, module=ei_cli, subcommand='entry-ids')
+def test_help(mocker, capsys):
+    u.assert_help(mocker=mocker, capsys=capsys, module=ei_cli, subcommand='entry-ids')
 
 
 test_data = [
@@ -27,24 +27,26 @@ test_data = [
      {'database': 'drug', 'formula': None, 'exact_mass': None, 'molecular_weight': (202, 303)}, None),
     (['entry-ids', 'keywords', 'pathway', '-'], 'entry_ids_cli.ei.from_keywords',
      {'database': 'pathway', 'keywords': ['k1', 'k2']}, 'k1\nk2')]
+test_data_ids = [' '.join(args) for args, *_ in test_data]
+parametrize_test_data = pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data, ids=test_data_ids)
 
 
 # noinspection DuplicatedCode
-@pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data)
-def test_print(mocker, args: list, method: str, kwargs: dict, stdin_mock: str):
+@parametrize_test_data
+def test_print(mocker, capsys, args: list, method: str, kwargs: dict, stdin_mock: str):
     u.test_print(
-        mocker=mocker, argv_mock=args, stdin_mock=stdin_mock, method=method, method_return_value=entry_ids_mock, method_kwargs=kwargs,
-        module=ei_cli, expected_output=expected_output)
+        mocker=mocker, capsys=capsys, argv_mock=args, stdin_mock=stdin_mock, method=method, method_return_value=entry_ids_mock,
+        method_kwargs=kwargs, module=ei_cli, expected_output=expected_output)
 
 
-@pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data)
+@parametrize_test_data
 def test_file(mocker, args: list, method: str, kwargs: dict, output_file: str, stdin_mock: str):
     u.test_file(
         mocker=mocker, argv_mock=args, output_file=output_file, stdin_mock=stdin_mock, method=method, method_return_value=entry_ids_mock,
         method_kwargs=kwargs, module=ei_cli, expected_output=expected_output)
 
 
-@pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data)
+@parametrize_test_data
 def test_zip_archive(mocker, args: list, method: str, kwargs: dict, zip_archive_data: tuple, stdin_mock: str):
     u.test_zip_archive(
         mocker=mocker, argv_mock=args, zip_archive_data=zip_archive_data, stdin_mock=stdin_mock, method=method,
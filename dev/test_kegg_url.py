@@ -1,21 +1,26 @@
 # noinspection PyPackageRequirements
 import pytest as pt
 import requests as rq
+import types
 import kegg_pull.kegg_url as ku
 import dev.utils as u
 
 
-test_validate_exception_data = [
-    (ku.KeywordsFindKEGGurl, {'database': 'ko', 'keywords': ['keyword'] * 500},
+# Shared by the error messages listing valid database names that include organisms
+organism_valid_values = 'Valid values are: <org>, '
+organism_note = 'Where <org> is an organism code or T number.'
+# Enough keywords for the find URL to exceed the maximum URL length
+too_many_keywords = ('keyword',) * 500
+test_validate_exception_data = (
+    (ku.KeywordsFindKEGGurl, {'database': 'ko', 'keywords': too_many_keywords},
      'The KEGG URL length of 4028 exceeds the limit of 4000'),
     (ku.ListKEGGurl, {'database': 'ligand'},
-     'Invalid database name: "ligand". Valid values are: <org>, ag, atc, brite, brite_ja, compound, compound_ja, '
+     f'Invalid database name: "ligand". {organism_valid_values}ag, atc, brite, brite_ja, compound, compound_ja, '
      'dgroup, dgroup_ja, disease, disease_ja, drug, drug_ja, enzyme, genome, glycan, jtc, ko, module, ndc, network, '
-     'organism, pathway, rclass, reaction, variant, vg, vp, yj. Where <org> is an organism code or T number.'),
+     f'organism, pathway, rclass, reaction, variant, vg, vp, yj. {organism_note}'),
     (ku.InfoKEGGurl, {'database': 'organism'},
-     'Invalid database name: "organism". Valid values are: <org>, ag, brite, compound, dgroup, disease, drug, '
-     'enzyme, genes, genome, glycan, kegg, ko, ligand, module, network, pathway, rclass, reaction, variant, vg, vp.'
-     ' Where <org> is an organism code or T number.'),
+     f'Invalid database name: "organism". {organism_valid_values}ag, brite, compound, dgroup, disease, drug, '
+     f'enzyme, genes, genome, glycan, kegg, ko, ligand, module, network, pathway, rclass, reaction, variant, vg, vp. {organism_note}'),
     (ku.GetKEGGurl, {'entry_ids': [], 'entry_field': None}, 'Entry IDs must be specified for the KEGG get operation'),
     (ku.GetKEGGurl, {'entry_ids': ['x'], 'entry_field': 'invalid-entry-field'},
      'Invalid KEGG entry field: "invalid-entry-field". Valid values are: aaseq, conf, image, json, kcf, kgml, mol, '
@@ -26,9 +31,9 @@ test_validate_exception_data = [
      f'The maximum number of entry IDs is {ku.GetKEGGurl.MAX_ENTRY_IDS_PER_URL} but 11 were provided'),
     (ku.KeywordsFindKEGGurl, {'database': 'not-brite', 'keywords': []}, 'No search keywords specified'),
     (ku.KeywordsFindKEGGurl, {'database': 'brite', 'keywords': ['x']},
-     'Invalid database name: "brite". Valid values are: <org>, ag, atc, brite_ja, compound, compound_ja, dgroup, '
+     f'Invalid database name: "brite". {organism_valid_values}ag, atc, brite_ja, compound, compound_ja, dgroup, '
      'dgroup_ja, disease, disease_ja, drug, drug_ja, enzyme, genes, genome, glycan, jtc, ko, ligand, module, ndc, '
-     'network, pathway, rclass, reaction, variant, vg, vp, yj. Where <org> is an organism code or T number.'),
+     f'network, pathway, rclass, reaction, variant, vg, vp, yj. {organism_note}'),
     (ku.MolecularFindKEGGurl, {'database': 'glycan'}, 'Invalid molecular database name: "glycan". Valid values are: compound, drug.'),
     (ku.MolecularFindKEGGurl, {'database': 'drug'}, 'Must provide either a chemical formula, exact mass, or molecular weight option'),
     (ku.MolecularFindKEGGurl, {'database': 'compound', 'exact_mass': ()},
@@ -48,8 +53,7 @@ test_validate_exception_data = [
     (ku.MolecularFindKEGGurl, {'database': 'drug', 'molecular_weight': (101, 101)},
      'The first value in the range must be less than the second. Values provided: 101-101'),
     (ku.DatabaseConvKEGGurl, {'kegg_database': 'genes', 'outside_database': ''},
-     'Invalid KEGG database: "genes". Valid values are: <org>, compound, drug, glycan. Where <org> is an organism '
-     'code or T number.'),
+     f'Invalid KEGG database: "genes". {organism_valid_values}compound, drug, glycan. {organism_note}'),
     (ku.DatabaseConvKEGGurl, {'kegg_database': 'drug', 'outside_database': 'glycan'},
      'Invalid outside database: "glycan". Valid values are: chebi, ncbi-geneid, ncbi-proteinid, pubchem, uniprot.'),
     (ku.DatabaseConvKEGGurl, {'kegg_database': 'organism-T-number', 'outside_database': 'pubchem'},
@@ -57,27 +61,25 @@ test_validate_exception_data = [
     (ku.DatabaseConvKEGGurl, {'kegg_database': 'compound', 'outside_database': 'ncbi-geneid'},
      'KEGG database "compound" is a molecule database but outside database "ncbi-geneid" is not.'),
     (ku.EntriesConvKEGGurl, {'target_database': 'rclass', 'entry_ids': []},
-     'Invalid target database: "rclass". Valid values are: <org>, chebi, compound, drug, genes, glycan, ncbi-geneid,'
-     ' ncbi-proteinid, pubchem, uniprot. Where <org> is an organism code or T number.'),
+     f'Invalid target database: "rclass". {organism_valid_values}chebi, compound, drug, genes, glycan, ncbi-geneid,'
+     f' ncbi-proteinid, pubchem, uniprot. {organism_note}'),
     (ku.EntriesConvKEGGurl, {'target_database': 'chebi', 'entry_ids': []},
      'Entry IDs must be specified for this KEGG "conv" operation'),
     (ku.DatabaseLinkKEGGurl, {'target_database': 'genes', 'source_database': ''},
-     'Invalid database name: "genes". Valid values are: <org>, ag, atc, brite, compound, dgroup, disease, drug, '
-     'enzyme, genome, glycan, jtc, ko, module, ndc, network, pathway, pubmed, rclass, reaction, variant, vg, vp, yj.'
-     ' Where <org> is an organism code or T number.'),
+     f'Invalid database name: "genes". {organism_valid_values}ag, atc, brite, compound, dgroup, disease, drug, '
+     f'enzyme, genome, glycan, jtc, ko, module, ndc, network, pathway, pubmed, rclass, reaction, variant, vg, vp, yj. {organism_note}'),
     (ku.DatabaseLinkKEGGurl, {'target_database': 'ndc', 'source_database': 'kegg'},
-     'Invalid database name: "kegg". Valid values are: <org>, ag, atc, brite, compound, dgroup, disease, drug, '
-     'enzyme, genome, glycan, jtc, ko, module, ndc, network, pathway, pubmed, rclass, reaction, variant, vg, vp, yj.'
-     ' Where <org> is an organism code or T number.'),
+     f'Invalid database name: "kegg". {organism_valid_values}ag, atc, brite, compound, dgroup, disease, drug, '
+     f'enzyme, genome, glycan, jtc, ko, module, ndc, network, pathway, pubmed, rclass, reaction, variant, vg, vp, yj. {organism_note}'),
     (ku.DatabaseLinkKEGGurl, {'target_database': 'drug', 'source_database': 'drug'},
      'The source and target database cannot be identical. Database selected: drug.'),
     (ku.EntriesLinkKEGGurl, {'target_database': 'ligand', 'entry_ids': []},
-     'Invalid database name: "ligand". Valid values are: <org>, ag, atc, brite, compound, dgroup, disease, drug, '
+     f'Invalid database name: "ligand". {organism_valid_values}ag, atc, brite, compound, dgroup, disease, drug, '
      'enzyme, genes, genome, glycan, jtc, ko, module, ndc, network, pathway, pubmed, rclass, reaction, variant, vg, '
-     'vp, yj. Where <org> is an organism code or T number.'),
+     f'vp, yj. {organism_note}'),
     (ku.EntriesLinkKEGGurl, {'target_database': 'yj', 'entry_ids': []},
      'At least one entry ID must be specified to perform the link operation'),
-    (ku.DdiKEGGurl, {'drug_entry_ids': []}, 'At least one drug entry ID must be specified for the DDI operation')]
+    (ku.DdiKEGGurl, {'drug_entry_ids': []}, 'At least one drug entry ID must be specified for the DDI operation'))
 
 
 @pt.mark.parametrize('KEGGurl,kwargs,expected_message', test_validate_exception_data)
@@ -88,13 +90,13 @@ def test_validate_exception(KEGGurl: type, kwargs: dict, expected_message: str):
     u.assert_exception(expected_message=expected_message, exception=error)
 
 
-test_validate_warning_data = [
+test_validate_warning_data = (
     (ku.MolecularFindKEGGurl, {'database': 'compound', 'formula': 'O3', 'exact_mass': 20.2},
      'Only a chemical formula, exact mass, or molecular weight is used to construct the URL. Using formula...', 'find/compound/O3/formula'),
     (ku.MolecularFindKEGGurl, {'database': 'drug', 'formula': 'O3', 'molecular_weight': 200},
      'Only a chemical formula, exact mass, or molecular weight is used to construct the URL. Using formula...', 'find/drug/O3/formula'),
     (ku.MolecularFindKEGGurl, {'database': 'compound', 'exact_mass': 20.2, 'molecular_weight': 200},
-     'Both an exact mass and molecular weight are provided. Using exact mass...', 'find/compound/20.2/exact_mass')]
+     'Both an exact mass and molecular weight are provided. Using exact mass...', 'find/compound/20.2/exact_mass'))
 
 
 @pt.mark.parametrize('KEGGurl,kwargs,expected_message,url', test_validate_warning_data)
@@ -105,7 +107,7 @@ def test_validate_warning(KEGGurl: type, kwargs: dict, expected_message: str, ur
     assert kegg_url.url == expected_url
 
 
-test_create_rest_options_data = [
+test_create_rest_options_data = (
     (ku.ListKEGGurl, {'database': 'vg'}, 'list', 'vg'),
     (ku.ListKEGGurl, {'database': 'organism-code'}, 'list', 'organism-code'),
     (ku.ListKEGGurl, {'database': 'organism'}, 'list', 'organism'),
@@ -128,7 +130,7 @@ test_create_rest_options_data = [
     (ku.DatabaseLinkKEGGurl, {'target_database': 'pubmed', 'source_database': 'atc'}, 'link', 'pubmed/atc'),
     (ku.EntriesLinkKEGGurl, {'target_database': 'genes', 'entry_ids': ['a', 'b', 'c']}, 'link', 'genes/a+b+c'),
     (ku.EntriesLinkKEGGurl, {'target_database': 'jtc', 'entry_ids': ['x']}, 'link', 'jtc/x'),
-    (ku.DdiKEGGurl, {'drug_entry_ids': ['x', 'y']}, 'ddi', 'x+y')]
+    (ku.DdiKEGGurl, {'drug_entry_ids': ['x', 'y']}, 'ddi', 'x+y'))
 
 
 @pt.mark.parametrize('KEGGurl,kwargs,rest_operation,rest_options', test_create_rest_options_data)
@@ -137,26 +139,24 @@ def test_create_rest_options(KEGGurl: type, kwargs: dict, rest_operation: str, r
     expected_url = f'{ku.BASE_URL}/{rest_operation}/{rest_options}'
     assert str(kegg_url) == kegg_url.url == expected_url
     if KEGGurl == ku.GetKEGGurl:
-        assert kegg_url.__getattribute__('multiple_entry_ids') == (len(kegg_url.__getattribute__('entry_ids')) > 1)
+        # noinspection PyUnresolvedReferences
+        assert kegg_url.multiple_entry_ids == (len(kegg_url.entry_ids) > 1)
 
 
-@pt.fixture(name='_')
-def reset_organism_set():
-    ku.AbstractKEGGurl._organism_set = None
+organism_list_text_mock = """
+    T06555	psyt	Candidatus Prometheoarchaeum syntrophicum	Prokaryotes;Archaea;Lokiarchaeota;Prometheoarchaeum
+    T03835	agw	Archaeon GW2011_AR10	Prokaryotes;Archaea;unclassified Archaea
+    T03843	arg	Archaeon GW2011_AR20	Prokaryotes;Archaea;unclassified Archaea
+"""
+expected_organism_set = frozenset({'agw', 'T03835', 'T06555', 'T03843', 'psyt', 'arg'})
 
 
-@pt.mark.disable_mock_organism_set
-def test_organism_set(mocker, _):
-    text_mock = """
-        T06555	psyt	Candidatus Prometheoarchaeum syntrophicum	Prokaryotes;Archaea;Lokiarchaeota;Prometheoarchaeum
-        T03835	agw	Archaeon GW2011_AR10	Prokaryotes;Archaea;unclassified Archaea
-        T03843	arg	Archaeon GW2011_AR20	Prokaryotes;Archaea;unclassified Archaea
-    """
-    response_mock = mocker.MagicMock(status_code=200, text=text_mock)
-    get_mock: mocker.MagicMock = mocker.patch('kegg_pull.kegg_url.rq.get', return_value=response_mock)
+@pt.mark.usefixtures('unmocked_organism_set')
+def test_organism_set(mocker):
+    response_stub = types.SimpleNamespace(status_code=200, text=organism_list_text_mock)
+    get_mock: mocker.MagicMock = mocker.patch('kegg_pull.kegg_url.rq.get', return_value=response_stub)
     actual_organism_set = ku.AbstractKEGGurl.organism_set
     get_mock.assert_called_once_with(url=f'{ku.BASE_URL}/list/organism', timeout=60)
-    expected_organism_set = {'agw', 'T03835', 'T06555', 'T03843', 'psyt', 'arg'}
     assert actual_organism_set == expected_organism_set
     get_mock.reset_mock()
     actual_organism_set = ku.AbstractKEGGurl.organism_set
@@ -164,9 +164,9 @@ def test_organism_set(mocker, _):
     assert actual_organism_set == expected_organism_set
 
 
-@pt.mark.parametrize('timeout', [True, False])
-@pt.mark.disable_mock_organism_set
-def test_organism_set_unsuccessful(mocker, timeout: bool, _):
+@pt.mark.usefixtures('unmocked_organism_set')
+@pt.mark.parametrize('timeout', [True, False], ids=['timeout', 'http-error'])
+def test_organism_set_unsuccessful(mocker, timeout: bool):
     get_function_patch_path = 'kegg_pull.kegg_url.rq.get'
     url = f'{ku.BASE_URL}/list/organism'
     error_message = 'The request to the KEGG web API {} while fetching the organism set using the URL: {}'
@@ -176,7 +176,7 @@ def test_organism_set_unsuccessful(mocker, timeout: bool, _):
     else:
         failed_status_code = 404
         get_mock: mocker.MagicMock = mocker.patch(
-            get_function_patch_path, return_value=mocker.MagicMock(status_code=failed_status_code))
+            get_function_patch_path, return_value=types.SimpleNamespace(status_code=failed_status_code))
         error_message: str = error_message.format(f'failed with status code {failed_status_code}', url)
     with pt.raises(RuntimeError) as error:
         ku.AbstractKEGGurl.organism_set()
@@ -2,8 +2,9 @@
 import pytest as pt
 import zipfile as zf
 import os
-import shutil as sh
 import json
+import sys
+import io
 import kegg_pull.__main__ as m
 import kegg_pull.entry_ids_cli as ei_cli
 import kegg_pull.rest_cli as r_cli
@@ -12,156 +13,137 @@ import kegg_pull.map_cli as map_cli
 import kegg_pull.pathway_organizer_cli as po_cli
 import dev.utils as u
 
+delimiter: str = '-'*80
+expected_full_help: str = ''.join(
+    f'{help_section}\n' for help_section in (
+        m.__doc__, delimiter, p_cli.__doc__, delimiter, ei_cli.__doc__, delimiter, map_cli.__doc__, delimiter, po_cli.__doc__,
+        delimiter, r_cli.__doc__))
 
-def test_help(mocker):
-    mocker.patch('sys.argv', ['kegg_pull', '--full-help'])
-    print_mock: mocker.MagicMock = mocker.patch('builtins.print')
+
+def test_help(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['kegg_pull', '--full-help'])
     m.main()
-    delimiter: str = '-'*80
-    expected_print_call_args = [
-        (m.__doc__,), (delimiter,), (p_cli.__doc__,), (delimiter,), (ei_cli.__doc__,), (delimiter,), (map_cli.__doc__,),
-        (delimiter,), (po_cli.__doc__,), (delimiter,), (r_cli.__doc__,)]
-    u.assert_call_args(function_mock=print_mock, expected_call_args_list=expected_print_call_args, do_kwargs=False)
+    assert capsys.readouterr().out == expected_full_help
     for help_arg in (['--help'], ['-h'], []):
         help_args = ['kegg_pull']
         help_args.extend(help_arg)
-        mocker.patch('sys.argv', help_args)
-        print_mock.reset_mock()
+        monkeypatch.setattr(sys, 'argv', help_args)
         m.main()
-        print_mock.assert_called_once_with(m.__doc__)
+        assert capsys.readouterr().out == f'{m.__doc__}\n'
 
 
-def test_version(mocker):
-    mocker.patch('sys.argv', ['kegg_pull', '--version'])
+def test_version(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['kegg_pull', '--version'])
     version_mock = 'version mock'
-    mocker.patch('kegg_pull.__main__.__version__', version_mock)
-    print_mock: mocker.MagicMock = mocker.patch('builtins.print')
+    monkeypatch.setattr(m, '__version__', version_mock)
     m.main()
-    print_mock.assert_called_once_with(version_mock)
-    print_mock.reset_mock()
-    mocker.patch('sys.argv', ['kegg_pull', '-v'])
+    assert capsys.readouterr().out == f'{version_mock}\n'
+    monkeypatch.setattr(sys, 'argv', ['kegg_pull', '-v'])
     m.main()
-    print_mock.assert_called_once_with(version_mock)
+    assert capsys.readouterr().out == f'{version_mock}\n'
 
 
 @pt.fixture(name='print_output', params=[True, False])
-def print_output_fixture(request):
-    print_output: bool = request.param
-    yield print_output
-    if not print_output:
-        os.remove('output.txt')
+def print_output_fixture(request, in_tmp_path):
+    yield request.param
 
 
 test_entry_ids_data = [
-    (['database', 'brite'], 'dev/test_data/all-brite-entry-ids.txt'),
-    (['keywords', 'module', 'Guanine,ribonucleotide'], 'dev/test_data/module-entry-ids.txt'),
-    (['molec-attr', 'drug', '--em=420', '--em=440'], 'dev/test_data/drug-entry-ids.txt')]
+    (['database', 'brite'], 'all-brite-entry-ids.txt'),
+    (['keywords', 'module', 'Guanine,ribonucleotide'], 'module-entry-ids.txt'),
+    (['molec-attr', 'drug', '--em=420', '--em=440'], 'drug-entry-ids.txt')]
 
 
 @pt.mark.parametrize('args,expected_output', test_entry_ids_data)
-def test_entry_ids(mocker, args: list, expected_output: str, print_output: bool):
+def test_entry_ids(monkeypatch, capsys, args: list, expected_output: str, print_output: bool):
     args: list = ['kegg_pull', 'entry-ids'] + args
-    _test_output(mocker=mocker, args=args, expected_output=expected_output, print_output=print_output)
+    _test_output(monkeypatch=monkeypatch, capsys=capsys, args=args, expected_output=expected_output, print_output=print_output)
 
 
-def _test_output(mocker, args: list, expected_output: str, print_output: bool, json_output: bool = False):
-    print_mock = None
-    if print_output:
-        print_mock: mocker.MagicMock = mocker.patch('builtins.print')
-    else:
+def _test_output(monkeypatch, capsys, args: list, expected_output: str, print_output: bool, json_output: bool = False):
+    if not print_output:
         args += ['--output=output.txt']
-    mocker.patch('sys.argv', args)
+    monkeypatch.setattr(sys, 'argv', args)
     m.main()
-    with open(expected_output, 'r') as file:
-        expected_output: str = file.read()
+    expected_output: str = u.read_test_data(file_path=expected_output)
     if print_output:
-        if json_output:
-            expected_json: dict = json.loads(expected_output)
-            [[actual_json], _] = print_mock.call_args
-            actual_json: str = actual_json
-            actual_json: dict = json.loads(actual_json)
-            assert actual_json == expected_json
-        else:
-            print_mock.assert_called_once_with(expected_output)
+        actual_output: str = capsys.readouterr().out
+        assert actual_output.endswith('\n')
+        actual_output = actual_output[:-1]
     else:
         with open('output.txt', 'r') as file:
             actual_output: str = file.read()
-        if json_output:
-            actual_json: dict = json.loads(actual_output)
-            expected_json: dict = json.loads(expected_output)
-            assert actual_json == expected_json
-        else:
-            assert actual_output == expected_output
+    if json_output and actual_output != expected_output:
+        actual_json: dict = json.loads(actual_output)
+        expected_json: dict = json.loads(expected_output)
+        assert actual_json == expected_json
+    elif not json_output:
+        assert actual_output == expected_output
 
 
 test_rest_data = [
-    (['conv', 'glycan', 'pubchem'], 'dev/test_data/glycan-pubchem-conv.txt'),
-    (['conv', 'entry-ids', 'gl:G13143,gl:G13141,gl:G13139', 'pubchem'], 'dev/test_data/glycan-pubchem-entry-ids.txt'),
-    (['link', 'module', 'pathway'], 'dev/test_data/module-pathway-link.txt'),
-    (['link', 'entry-ids', 'md:M00575,md:M00574,md:M00363', 'pathway'], 'dev/test_data/pathway-module-entry-ids.txt'),
-    (['ddi', 'D00564,D00100,D00109'], 'dev/test_data/ddi-output.txt')]
+    (['conv', 'glycan', 'pubchem'], 'glycan-pubchem-conv.txt'),
+    (['conv', 'entry-ids', 'gl:G13143,gl:G13141,gl:G13139', 'pubchem'], 'glycan-pubchem-entry-ids.txt'),
+    (['link', 'module', 'pathway'], 'module-pathway-link.txt'),
+    (['link', 'entry-ids', 'md:M00575,md:M00574,md:M00363', 'pathway'], 'pathway-module-entry-ids.txt'),
+    (['ddi', 'D00564,D00100,D00109'], 'ddi-output.txt')]
 
 
 @pt.mark.parametrize('args,expected_output', test_rest_data)
-def test_rest(mocker, args: list, expected_output: str, print_output: bool):
+def test_rest(monkeypatch, capsys, args: list, expected_output: str, print_output: bool):
     args = ['kegg_pull', 'rest'] + args
-    _test_output(mocker=mocker, args=args, expected_output=expected_output, print_output=print_output)
+    _test_output(monkeypatch=monkeypatch, capsys=capsys, args=args, expected_output=expected_output, print_output=print_output)
 
 
-@pt.fixture(name='output', params=['brite-entries.zip', 'brite-entries'])
-def pull_output(request):
-    output: str = request.param
-    yield output
-    if output == 'brite-entries.zip' and os.path.isfile(output):
-        os.remove(output)
-    else:
-        sh.rmtree(output, ignore_errors=True)
-    os.remove('pull-results.json')
+@pt.fixture(name='output', params=['brite-entries.zip', pt.param('brite-entries', marks=pt.mark.slow)])
+def pull_output(request, in_tmp_path):
+    yield request.param
 
 
 test_pull_data = [
-    ['--force-single-entry', '--multi-process', '--n-workers=2'], ['--print'], ['--print', '--multi-process'],
-    ['--multi-process', '--n-workers=2'], ['--force-single-entry']]
+    pt.param(['--force-single-entry', '--multi-process', '--n-workers=2'], marks=pt.mark.slow), ['--print'],
+    pt.param(['--print', '--multi-process'], marks=pt.mark.slow), pt.param(['--multi-process', '--n-workers=2'], marks=pt.mark.slow),
+    ['--force-single-entry']]
+pull_stdin_mock = """
+    br:br08005
+    br:br08902
+    br:br08431
+
+    br:br03220
+    br:br03222
+"""
+successful_pull_entry_ids = ['br:br08005', 'br:br08902', 'br:br08431']
+expected_pull_results = {
+    'successful-entry-ids': successful_pull_entry_ids,
+    'failed-entry-ids': ['br:br03220', 'br:br03222'],
+    'timed-out-entry-ids': [],
+    'num-successful': 3,
+    'num-failed': 2,
+    'num-timed-out': 0,
+    'num-total': 5,
+    'percent-success': 60.0,
+    'pull-minutes': 1.0}
+# The expected output file names have underscores instead of colons in case testing on Windows.
+expected_pull_output_files = [entry_id.replace(':', '_') for entry_id in successful_pull_entry_ids]
 
 
 @pt.mark.parametrize('args', test_pull_data)
-def test_pull(mocker, args: list, output: str):
-    stdin_mock = """
-        br:br08005
-        br:br08902
-        br:br08431
-
-        br:br03220
-        br:br03222
-    """
-    stdin_mock: mocker.MagicMock = mocker.patch('kegg_pull._utils.sys.stdin.read', return_value=stdin_mock)
-    successful_entry_ids = ['br:br08005', 'br:br08902', 'br:br08431']
-    # The expected output file names have underscores instead of colons in case testing on Windows.
-    expected_output_files = [entry_id.replace(':', '_') for entry_id in successful_entry_ids]
-    expected_pull_results = {
-        'successful-entry-ids': successful_entry_ids,
-        'failed-entry-ids': ['br:br03220', 'br:br03222'],
-        'timed-out-entry-ids': [],
-        'num-successful': 3,
-        'num-failed': 2,
-        'num-timed-out': 0,
-        'num-total': 5,
-        'percent-success': 60.0,
-        'pull-minutes': 1.0}
+def test_pull(mocker, monkeypatch, args: list, output: str):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(pull_stdin_mock))
+    successful_entry_ids: list = successful_pull_entry_ids
+    expected_output_files: list = expected_pull_output_files
     args = ['kegg_pull', 'pull', 'entry-ids', '-'] + args + [f'--output={output}']
-    mocker.patch('sys.argv', args)
+    monkeypatch.setattr(sys, 'argv', args)
     time_mock: mocker.MagicMock = mocker.patch('kegg_pull.pull_cli._testable_time', side_effect=[30, 90])
     print_mock = mocker.patch('builtins.print')
     m.main()
-    stdin_mock.assert_called_once_with()
     assert time_mock.call_count == 2
     # If running on Windows, change the actual files names to have underscores instead of colons.
     if os.name == 'nt':  # pragma: no cover
         expected_output_files = expected_output_files[:-1]  # The last brite gives different output on Windows
         successful_entry_ids = expected_output_files  # pragma: no cover
     for successful_entry_id, expected_output_file in zip(successful_entry_ids, expected_output_files):
-        with open(f'dev/test_data/brite-entries/{expected_output_file}.txt') as expected_file:
-            expected_entry: str = expected_file.read()
+        expected_entry: str = u.read_test_data(file_path=os.path.join('brite-entries', f'{expected_output_file}.txt'))
         if '--print' in args:
             print_mock.assert_any_call(successful_entry_id.replace('_', ':'))
             print_mock.assert_any_call(f'{expected_entry}\n')
@@ -188,21 +170,18 @@ test_map_data = [
 
 
 @pt.mark.parametrize('args,stdin_mock_str,expected_output', test_map_data)
-@pt.mark.disable_mock_organism_set
-def test_map(mocker, print_output: bool, args: list, stdin_mock_str: str, expected_output: str):
+@pt.mark.usefixtures('unmocked_organism_set')
+def test_map(monkeypatch, capsys, print_output: bool, args: list, stdin_mock_str: str, expected_output: str):
     args: list = ['kegg_pull', 'map'] + args
-    stdin_mock = None
     if stdin_mock_str:
-        stdin_mock: mocker.MagicMock = mocker.patch('kegg_pull._utils.sys.stdin.read', return_value=stdin_mock_str)
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(stdin_mock_str))
     _test_output(
-        mocker=mocker, args=args, expected_output=f'dev/test_data/map/{expected_output}.json', print_output=print_output,
+        monkeypatch=monkeypatch, capsys=capsys, args=args, expected_output=f'map/{expected_output}.json', print_output=print_output,
         json_output=True)
-    if stdin_mock:
-        stdin_mock.assert_called_once_with()
 
 
-def test_pathway_organizer(mocker, print_output: bool):
+def test_pathway_organizer(monkeypatch, capsys, print_output: bool):
     args = ['kegg_pull', 'pathway-organizer', '--tln=Metabolism', '--fn=Global and overview maps']
     _test_output(
-        mocker=mocker, args=args, expected_output='dev/test_data/pathway-organizer/metabolic-pathways.json',
+        monkeypatch=monkeypatch, capsys=capsys, args=args, expected_output='pathway-organizer/metabolic-pathways.json',
         print_output=print_output, json_output=True)
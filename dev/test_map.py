@@ -1,6 +1,7 @@
 # noinspection PyPackageRequirements
 import pytest as pt
 import typing as t
+import types
 import jsonschema as js
 import kegg_pull.map as kmap
 import kegg_pull.kegg_url as ku
@@ -16,47 +17,51 @@ def get_kegg_rest(request, mocker):
         yield None
 
 
+@pt.fixture(name='to_dict_mock')
+def mock_to_dict(mocker):
+    yield mocker.patch('kegg_pull.map._to_dict')
+
+
 @pt.fixture(name='reverse', params=[True, False])
 def get_reverse(request):
     yield request.param
 
 
+to_dict_text_body_mock = """
+    a1\tb1
+    a1\tb2
+    a1\tb3
+    a2\tb1
+    a2\tb4
+    a3\tb3
+    a4\tb5
+    a5\tb6
+    a5\tb7
+"""
+expected_to_dict_mapping = {'a1': {'b1', 'b2', 'b3'}, 'a2': {'b1', 'b4'}, 'a3': {'b3'}, 'a4': {'b5'}, 'a5': {'b6', 'b7'}}
+
+
 def test_to_dict(mocker, kegg_rest):
-    kegg_rest = kegg_rest
-    text_body_mock = """
-        a1\tb1
-        a1\tb2
-        a1\tb3
-        a2\tb1
-        a2\tb4
-        a3\tb3
-        a4\tb5
-        a5\tb6
-        a5\tb7
-    """
     kwargs_mock = {'kegg_rest': kegg_rest, 'KEGGurl': ku.EntriesLinkKEGGurl, 'k': 'v'}
-    kegg_response_mock = mocker.MagicMock(text_body=text_body_mock)
+    kegg_response_stub = types.SimpleNamespace(text_body=to_dict_text_body_mock)
     request_and_check_error_mock: mocker.MagicMock = mocker.patch(
-        'kegg_pull.map.r.request_and_check_error', return_value=kegg_response_mock)
+        'kegg_pull.map.r.request_and_check_error', return_value=kegg_response_stub)
     actual_mapping: kmap.KEGGmapping = kmap._to_dict(**kwargs_mock)
     request_and_check_error_mock.assert_called_once_with(**kwargs_mock)
-    expected_mapping = {
-        'a1': {'b1', 'b2', 'b3'}, 'a2': {'b1', 'b4'}, 'a3': {'b3'}, 'a4': {'b5'}, 'a5': {'b6', 'b7'}}
-    assert actual_mapping == expected_mapping
+    assert actual_mapping == expected_to_dict_mapping
 
 
 test_map_and_reverse_data = [
-    ('database_conv', ku.DatabaseConvKEGGurl, {'kegg_database': 'kegg-db', 'outside_database': 'outside-db'}),
-    ('entries_conv', ku.EntriesConvKEGGurl, {'entry_ids': ['e1', 'e2'], 'target_database': 'x'}),
-    ('entries_link', ku.EntriesLinkKEGGurl, {'entry_ids': ['e1', 'e2'], 'target_database': 'x'})]
+    (kmap.database_conv, ku.DatabaseConvKEGGurl, {'kegg_database': 'kegg-db', 'outside_database': 'outside-db'}),
+    (kmap.entries_conv, ku.EntriesConvKEGGurl, {'entry_ids': ['e1', 'e2'], 'target_database': 'x'}),
+    (kmap.entries_link, ku.EntriesLinkKEGGurl, {'entry_ids': ['e1', 'e2'], 'target_database': 'x'})]
+test_map_and_reverse_ids = [method.__name__ for method, *_ in test_map_and_reverse_data]
 
 
-@pt.mark.parametrize('method,KEGGurl,kwargs', test_map_and_reverse_data)
-def test_map_and_reverse(mocker, method: str, KEGGurl: type, kwargs: dict, reverse: bool, kegg_rest):
+@pt.mark.parametrize('method,KEGGurl,kwargs', test_map_and_reverse_data, ids=test_map_and_reverse_ids)
+def test_map_and_reverse(to_dict_mock, method: t.Callable, KEGGurl: type, kwargs: dict, reverse: bool, kegg_rest):
     expected_mapping = {'k': {'v1', 'v2'}}
-    to_dict_mock = mocker.patch('kegg_pull.map._to_dict', return_value=expected_mapping)
-    # noinspection PyUnresolvedReferences
-    method: t.Callable = kmap.__getattribute__(method)
+    to_dict_mock.return_value = expected_mapping
     actual_mapping: kmap.KEGGmapping = method(reverse=reverse, kegg_rest=kegg_rest, **kwargs)
     to_dict_mock.assert_called_once_with(KEGGurl=KEGGurl, kegg_rest=kegg_rest, **kwargs)
     if reverse:
@@ -69,12 +74,12 @@ test_deduplicate_pathway_ids_data = [
 
 
 @pt.mark.parametrize('kwargs', test_deduplicate_pathway_ids_data)
-def test_deduplicate_pathway_ids(mocker, kwargs: dict, kegg_rest):
+def test_deduplicate_pathway_ids(to_dict_mock, kwargs: dict, kegg_rest):
     kwargs['kegg_rest'] = kegg_rest
     to_dict_return = {'path:map1': {'x1'}, f'path:ko1': {'x1'}, 'path:map2': {'x2', 'x3'}, 'path:ko2': {'x2', 'x3'}}
     pathway_is_target = kwargs['target_database'] == 'pathway'
     to_dict_return = kmap.reverse(mapping=to_dict_return) if pathway_is_target else to_dict_return
-    to_dict_mock = mocker.patch('kegg_pull.map._to_dict', return_value=to_dict_return)
+    to_dict_mock.return_value = to_dict_return
     actual_mapping = kmap.database_link(deduplicate=True, **kwargs)
     to_dict_mock.assert_called_once_with(KEGGurl=ku.DatabaseLinkKEGGurl, **kwargs)
     expected_mapping = {'path:map1': {'x1'}, 'path:map2': {'x2', 'x3'}}
@@ -82,20 +87,20 @@ def test_deduplicate_pathway_ids(mocker, kwargs: dict, kegg_rest):
     assert actual_mapping == expected_mapping
 
 
-def test_deduplicate_pathway_ids_exception(mocker):
+@pt.mark.usefixtures('to_dict_mock')
+def test_deduplicate_pathway_ids_exception():
     message = f'Cannot deduplicate path:map entry ids when neither the source database nor the target database is set to "pathway".' \
               f' Databases specified: module, ko.'
-    mocker.patch('kegg_pull.map._to_dict')
     with pt.raises(ValueError) as error:
         kmap.database_link(source_database='module', target_database='ko', deduplicate=True)
     u.assert_exception(expected_message=message, exception=error)
 
 
-@pt.fixture(name='mapping_data', params=[(True, True), (False, True), (True, False), (False, False)])
-def get_mapping_data(request, mocker):
+@pt.fixture(name='mapping_data', scope='module', params=[(True, True), (False, True), (True, False), (False, False)])
+def get_mapping_data(request):
     add_glycans, add_drugs = request.param
 
-    def mapping_data(kegg_rest: mocker.MagicMock | None, kwargs: dict) -> tuple:
+    def mapping_data(kegg_rest: t.Any, kwargs: dict) -> tuple:
         compound_is_target = kwargs['target_database'] == 'compound'
         expected_call_args_list = [kwargs]
         compound_to_x = {'cpd1': {'x1', 'x2'}, 'cpd2': {'x1'}, 'cpd3': {'x2'}, 'cpd4': {'x3'}, 'cpd5': {'x2'}, 'cpd6': {'x4'}}
@@ -140,18 +145,18 @@ test_add_glycans_or_drugs_data = [
 
 
 @pt.mark.parametrize('kwargs', test_add_glycans_or_drugs_data)
-def test_add_glycans_or_drugs(mocker, kegg_rest, mapping_data: t.Callable, kwargs: dict):
+def test_add_glycans_or_drugs(to_dict_mock, kegg_rest, mapping_data: t.Callable, kwargs: dict):
     add_glycans, add_drugs, expected_call_args_list, to_dict_side_effect, expected_mapping = mapping_data(
         kegg_rest=kegg_rest, kwargs=kwargs)
-    to_dict_mock: mocker.MagicMock = mocker.patch('kegg_pull.map._to_dict', side_effect=to_dict_side_effect)
+    to_dict_mock.side_effect = to_dict_side_effect
     # noinspection PyUnresolvedReferences
     actual_mapping: kmap.KEGGmapping = kmap.database_link(add_drugs=add_drugs, add_glycans=add_glycans, kegg_rest=kegg_rest, **kwargs)
     u.assert_call_args(function_mock=to_dict_mock, expected_call_args_list=expected_call_args_list, do_kwargs=True)
     assert actual_mapping == expected_mapping
 
 
-def test_add_glycans_or_drugs_warning(mocker, caplog):
-    mocker.patch('kegg_pull.map._to_dict')
+@pt.mark.usefixtures('to_dict_mock')
+def test_add_glycans_or_drugs_warning(caplog):
     expected_message = f'Adding compound IDs (corresponding to equivalent glycan and/or drug entries) to a mapping where ' \
                        f'neither the source database nor the target database are "compound". Databases specified: reaction, ko.'
     kmap.database_link(source_database='reaction', target_database='ko', add_glycans=True)
@@ -162,7 +167,7 @@ test_indirect_link_data = ['drugs_and_glycans', 'deduplicate', 'drugs_and_glycan
 
 
 @pt.mark.parametrize('test_case', test_indirect_link_data)
-def test_indirect_link(mocker, kegg_rest, test_case: str):
+def test_indirect_link(to_dict_mock, kegg_rest, test_case: str):
     kegg_rest = kegg_rest
     compound_to_reaction = {'cpd1': {'rn1', 'rn3'}, 'cpd2': {'rn2'}, 'cpd3': {'rn3'}}
     pathway_to_reaction = {
@@ -183,7 +188,7 @@ def test_indirect_link(mocker, kegg_rest, test_case: str):
             {'source_database': 'compound', 'target_database': 'drug'}, {'source_database': 'drug', 'target_database': 'ko'}])
         side_effect = [
             compound_to_reaction, reaction_to_gene, compound_to_glycan, glycan_to_gene, compound_to_drug, drug_to_gene]
-        to_dict_mock = mocker.patch('kegg_pull.map._to_dict', side_effect=side_effect)
+        to_dict_mock.side_effect = side_effect
         actual_mapping = kmap.indirect_link(
             source_database='compound', intermediate_database='reaction', target_database='ko', add_glycans=True, add_drugs=True,
             kegg_rest=kegg_rest)
@@ -191,7 +196,7 @@ def test_indirect_link(mocker, kegg_rest, test_case: str):
     elif test_case == 'deduplicate':
         expected_call_args_list = [
             {'source_database': 'pathway', 'target_database': 'reaction'}, {'source_database': 'reaction', 'target_database': 'ko'}]
-        to_dict_mock = mocker.patch('kegg_pull.map._to_dict', side_effect=[pathway_to_reaction, reaction_to_gene])
+        to_dict_mock.side_effect = [pathway_to_reaction, reaction_to_gene]
         actual_mapping = kmap.indirect_link(
             source_database='pathway', intermediate_database='reaction', target_database='ko', deduplicate=True,
             kegg_rest=kegg_rest)
@@ -206,7 +211,7 @@ def test_indirect_link(mocker, kegg_rest, test_case: str):
             {'source_database': 'compound', 'target_database': 'drug'}, {'source_database': 'drug', 'target_database': 'pathway'}]
         side_effect = [
             compound_to_reaction, reaction_to_pathway, compound_to_glycan, glycan_to_pathway, compound_to_drug, drug_to_pathway]
-        to_dict_mock = mocker.patch('kegg_pull.map._to_dict', side_effect=side_effect)
+        to_dict_mock.side_effect = side_effect
         actual_mapping = kmap.indirect_link(
             source_database='compound', intermediate_database='reaction', target_database='pathway',
             deduplicate=True, add_glycans=True, add_drugs=True, kegg_rest=kegg_rest)
@@ -214,7 +219,7 @@ def test_indirect_link(mocker, kegg_rest, test_case: str):
             'cpd1': {'path:map1', 'path:map3', 'path:map4'}, 'cpd2': {'path:map2'}, 'cpd3': {'path:map1', 'path:map3', 'path:map6'}}
     else:
         expected_call_args_list = compound_to_gene_expected_call_args_list
-        to_dict_mock = mocker.patch('kegg_pull.map._to_dict', side_effect=[compound_to_reaction, reaction_to_gene])
+        to_dict_mock.side_effect = [compound_to_reaction, reaction_to_gene]
         actual_mapping = kmap.indirect_link(
             source_database='compound', intermediate_database='reaction', target_database='ko',
             kegg_rest=kegg_rest)
@@ -257,10 +262,8 @@ def test_reverse():
 
 
 def test_to_json_string():
-    mapping = {'k1': {'v1'}, 'k2': {'v1', 'v2'}, 'k3': {'v3', 'v4'}}
-    expected_json_string = '{\n  "k1": [\n    "v1"\n  ],\n  "k2": [\n    "v1",\n    "v2"\n  ],\n  "k3": [\n    "v3",\n    "v4"\n  ]\n}'
-    actual_json_string: str = kmap.to_json_string(mapping=mapping)
-    assert actual_json_string == expected_json_string
+    actual_json_string: str = kmap.to_json_string(mapping=u.mapping_mock)
+    assert actual_json_string == u.mapping_json_mock
 
 
 def test_save_to_json(json_file_path: str):
@@ -274,7 +277,7 @@ def test_load_from_json(json_file_path: str):
         expected_loaded_object={'k1': {'v1'}, 'k2': {'v3', 'v2'}})
 
 
-test_invalid_save_to_json_data = [{'a': [1]}, {'a': [1.2]}, {'a': [[], []]}, {'a': {}}, {'a': []}, {'': ['b']}]
+test_invalid_save_to_json_data = ({'a': [1]}, {'a': [1.2]}, {'a': [[], []]}, {'a': {}}, {'a': []}, {'': ['b']})
 expected_error_message = 'The mapping must be a dictionary of entry IDs (strings) mapped to a set of entry IDs'
 
 
@@ -286,10 +289,9 @@ def test_invalid_save_to_json(caplog, invalid_json_object: dict):
         message=expected_error_message, caplog=caplog)
 
 
-test_invalid_load_from_json_data = test_invalid_save_to_json_data.copy()
-test_invalid_load_from_json_data.extend([
+test_invalid_load_from_json_data = test_invalid_save_to_json_data + (
     ['1', '2'], {'a': 'b'}, {'a': [2]}, 'abc', 123, 123.123, {1: 2}, {1.2: 2.3}, {'a': [{}, {}]}, {'a': ['b', 1]},
-    {'a': [1.2, 'b']}])
+    {'a': [1.2, 'b']})
 
 
 @pt.mark.parametrize('invalid_json_object', test_invalid_load_from_json_data)
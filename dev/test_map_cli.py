@@ -3,11 +3,9 @@ import pytest as pt
 import kegg_pull.map_cli as map_cli
 import dev.utils as u
 
-mapping_mock = {'k1': {'v1'}, 'k2': {'v1', 'v2'}, 'k3': {'v3', 'v4'}}
 
-
-def test_help(mocker):
-    u.assert_help(mocker=mocker, module=map_cli, subcommand='map')
+def test_help(mocker, capsys):
+    u.assert_help(mocker=mocker, capsys=capsys, module=map_cli, subcommand='map')
 
 
 test_data = [
@@ -35,34 +33,27 @@ test_data = [
     (['link', 'compound', 'reaction', 'ko', '--add-glycans', '--add-drugs'], 'indirect_link',
      {'source_database': 'compound', 'intermediate_database': 'reaction', 'target_database': 'ko', 'deduplicate': False,
       'add_glycans': True, 'add_drugs': True}, None)]
+test_data_ids = [' '.join(args) for args, *_ in test_data]
+prepared_test_data = [(['map'] + args, f'map_cli.kmap.{method}', kwargs, stdin_mock) for args, method, kwargs, stdin_mock in test_data]
+parametrize_test_data = pt.mark.parametrize('args,method,kwargs,stdin_mock', prepared_test_data, ids=test_data_ids)
 
 
-def _prepare_input(args: list, method: str) -> tuple[list, str, str]:
-    args = ['map'] + args
-    method = f'map_cli.kmap.{method}'
-    expected_output = '{\n  "k1": [\n    "v1"\n  ],\n  "k2": [\n    "v1",\n    "v2"\n  ],\n  "k3": [\n    "v3",\n    "v4"\n  ]\n}'
-    return args, method, expected_output
-
-
-@pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data)
-def test_print(mocker, args: list, method: str, kwargs: dict, stdin_mock: str):
-    args, method, expected_output = _prepare_input(args=args, method=method)
+@parametrize_test_data
+def test_print(mocker, capsys, args: list, method: str, kwargs: dict, stdin_mock: str):
     u.test_print(
-        mocker=mocker, argv_mock=args, stdin_mock=stdin_mock, method=method, method_return_value=mapping_mock, method_kwargs=kwargs,
-        module=map_cli, expected_output=expected_output)
+        mocker=mocker, capsys=capsys, argv_mock=args, stdin_mock=stdin_mock, method=method, method_return_value=u.mapping_mock,
+        method_kwargs=kwargs, module=map_cli, expected_output=u.mapping_json_mock)
 
 
-@pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data)
+@parametrize_test_data
 def test_file(mocker, args: list, method: str, kwargs: dict, stdin_mock: str, output_file: str):
-    args, method, expected_output = _prepare_input(args=args, method=method)
     u.test_file(
         mocker=mocker, argv_mock=args, output_file=output_file, stdin_mock=stdin_mock, method=method,
-        method_return_value=mapping_mock, method_kwargs=kwargs, module=map_cli, expected_output=expected_output)
+        method_return_value=u.mapping_mock, method_kwargs=kwargs, module=map_cli, expected_output=u.mapping_json_mock)
 
 
-@pt.mark.parametrize('args,method,kwargs,stdin_mock', test_data)
+@parametrize_test_data
 def test_zip_archive(mocker, args: list, method: str, kwargs: dict, stdin_mock: str, zip_archive_data: tuple):
-    args, method, expected_output = _prepare_input(args=args, method=method)
     u.test_zip_archive(
         mocker=mocker, argv_mock=args, zip_archive_data=zip_archive_data, stdin_mock=stdin_mock, method=method,
-        method_return_value=mapping_mock, method_kwargs=kwargs, module=map_cli, expected_output=expected_output)
+        method_return_value=u.mapping_mock, method_kwargs=kwargs, module=map_cli, expected_output=u.mapping_json_mock)
@@ -1,7 +1,9 @@
 # noinspection PyPackageRequirements
 import pytest as pt
 import json
+import os
 import typing as t
+import types
 import kegg_pull.pathway_organizer as po
 import dev.utils as u
 
@@ -20,12 +22,9 @@ def test_load_from_kegg_warning(mocker, caplog):
 
 
 def _get_get_mock(mocker):
-    def get_mock(**_) -> mocker.MagicMock:
-        with open('dev/test_data/pathway-organizer/pathway-hierarchy.json', 'r') as file_:
-            text_body_mock: str = file_.read()
-        kegg_response_mock = mocker.MagicMock(text_body=text_body_mock)
-        return kegg_response_mock
-    return mocker.patch('kegg_pull.pathway_organizer.r.KEGGrest.get', wraps=get_mock)
+    text_body_mock: str = u.read_test_data(file_path=os.path.join('pathway-organizer', 'pathway-hierarchy.json'))
+    kegg_response_stub = types.SimpleNamespace(text_body=text_body_mock)
+    return mocker.patch('kegg_pull.pathway_organizer.r.KEGGrest.get', return_value=kegg_response_stub)
 
 
 test_load_from_kegg_data = [
@@ -50,8 +49,7 @@ def test_load_from_kegg(mocker, top_level_nodes: set, filter_nodes: set, hierarc
 
 
 def _get_expected_hierarchy_nodes(hierarchy_nodes_file: str) -> dict:
-    with open(f'dev/test_data/pathway-organizer/{hierarchy_nodes_file}') as file:
-        expected_hierarchy_nodes: dict = json.load(file)
+    expected_hierarchy_nodes: dict = json.loads(u.read_test_data(file_path=os.path.join('pathway-organizer', hierarchy_nodes_file)))
     return expected_hierarchy_nodes
 
 
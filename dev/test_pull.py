@@ -1,10 +1,10 @@
 # noinspection PyPackageRequirements
 import pytest as pt
-import shutil as sh
 import os
 import zipfile as zf
 import itertools as i
 import json
+import types
 import kegg_pull.rest as r
 import kegg_pull.pull as p
 import dev.utils as u
@@ -13,17 +13,15 @@ testing_entry_ids = ['1', '2']
 
 
 @pt.fixture(name='zip_file_path')
-def remove_zip_file():
-    zip_file_path = 'zip.zip'
-    yield zip_file_path
-    os.remove(zip_file_path)
+def get_zip_file_path(tmp_path):
+    yield str(tmp_path / 'zip.zip')
 
 
 def test_multiprocess_locking(mocker, zip_file_path: str):
     entry_ids_mock = ['xxx']
     expected_file_content = 'entry file content'
-    kegg_response_mock = mocker.MagicMock(
-        text_body=expected_file_content, kegg_url=mocker.MagicMock(multiple_entry_ids=False, entry_ids=entry_ids_mock),
+    kegg_response_mock = types.SimpleNamespace(
+        text_body=expected_file_content, kegg_url=types.SimpleNamespace(multiple_entry_ids=False, entry_ids=entry_ids_mock),
         status=r.KEGGresponse.Status.SUCCESS)
     get_mock: mocker.MagicMock = mocker.patch('kegg_pull.pull.r.KEGGrest.get', return_value=kegg_response_mock)
     lock_mock = mocker.MagicMock(acquire=mocker.MagicMock(), release=mocker.MagicMock())
@@ -42,16 +40,8 @@ def test_multiprocess_locking(mocker, zip_file_path: str):
 
 
 @pt.fixture(name='output_mock', params=['mock-dir/', 'mock.zip', None])
-def setup_and_teardown(request):
-    # Setup
-    output_mock = request.param
-    yield output_mock
-    # Tear down
-    if output_mock is not None:
-        if output_mock.endswith('.zip') and os.path.isfile(output_mock):
-            os.remove(output_mock)
-        else:
-            sh.rmtree(output_mock, ignore_errors=True)
+def get_output_mock(request, in_tmp_path):
+    yield request.param
 
 
 test_separate_entries_data = [(None, '///'), ('mol', '$$$$'), ('kcf', '///'), ('aaseq', '>'), ('ntseq', '>')]
@@ -65,9 +55,9 @@ def test_separate_entries(mocker, output_mock: str, entry_field: str, separator:
         text_body_mock = separator + separator.join(expected_entries)
     else:
         text_body_mock = separator.join(expected_entries) + separator
-    response_mock = mocker.MagicMock(
+    response_mock = types.SimpleNamespace(
         text_body=text_body_mock, status=r.KEGGresponse.Status.SUCCESS,
-        kegg_url=mocker.MagicMock(multiple_entry_ids=True, entry_ids=entry_ids_mock))
+        kegg_url=types.SimpleNamespace(multiple_entry_ids=True, entry_ids=entry_ids_mock))
     kegg_rest_mock = mocker.MagicMock(get=mocker.MagicMock(return_value=response_mock))
     KEGGrestMock = mocker.patch('kegg_pull.pull.r.KEGGrest', return_value=kegg_rest_mock)
     single_pull = p.SinglePull()
@@ -85,27 +75,25 @@ def test_separate_entries(mocker, output_mock: str, entry_field: str, separator:
         for entry_id_mock, expected_entry in zip(entry_ids_mock, expected_entries):
             assert kegg_entry_mapping[entry_id_mock] == expected_entry
     else:
-        for entry_id_mock, expected_file_content in zip(entry_ids_mock, expected_entries):
-            expected_file_extension = 'txt' if entry_field is None else entry_field
-            expected_file = f'{entry_id_mock}.{expected_file_extension}'
-            if output_mock.endswith('.zip'):
-                with zf.ZipFile(output_mock, 'r') as zip_file:
-                    actual_file_content: str = zip_file.read(name=expected_file).decode()
-            else:
-                expected_file: str = os.path.join(output_mock, expected_file)
-                with open(expected_file, 'r') as file:
-                    actual_file_content: str = file.read()
-            assert actual_file_content == expected_file_content
+        expected_file_extension = 'txt' if entry_field is None else entry_field
+        expected_files = [f'{entry_id_mock}.{expected_file_extension}' for entry_id_mock in entry_ids_mock]
+        if output_mock.endswith('.zip'):
+            with zf.ZipFile(output_mock, 'r') as zip_file:
+                actual_file_contents = [zip_file.read(name=expected_file).decode() for expected_file in expected_files]
+        else:
+            actual_file_contents = list[str]()
+            for expected_file in expected_files:
+                with open(os.path.join(output_mock, expected_file), 'r') as file:
+                    actual_file_contents.append(file.read())
+        assert actual_file_contents == expected_entries
 
 
 @pt.fixture(name='output_dir', params=['out-dir/', None])
-def make_and_remove_output_dir(request):
+def make_output_dir(request, in_tmp_path):
     output_dir = request.param
     if output_dir is not None:
         os.mkdir(output_dir)
     yield output_dir
-    if output_dir is not None:
-        sh.rmtree(output_dir)
 
 
 def test_pull_separate_entries(mocker, output_dir: str):
@@ -113,13 +101,13 @@ def test_pull_separate_entries(mocker, output_dir: str):
     failed_entry_id = 'fail-entry-id'
     time_out_entry_id = 'time-out-entry-id'
     entry_ids_mock = [failed_entry_id, success_entry_id, time_out_entry_id]
-    get_url_mock = mocker.MagicMock(multiple_entry_ids=True, entry_ids=entry_ids_mock)
-    initial_response_mock = mocker.MagicMock(status=r.KEGGresponse.Status.FAILED, kegg_url=get_url_mock)
-    entry_response_mock1 = mocker.MagicMock(status=r.KEGGresponse.Status.FAILED)
+    get_url_mock = types.SimpleNamespace(multiple_entry_ids=True, entry_ids=entry_ids_mock)
+    initial_response_mock = types.SimpleNamespace(status=r.KEGGresponse.Status.FAILED, kegg_url=get_url_mock)
+    entry_response_mock1 = types.SimpleNamespace(status=r.KEGGresponse.Status.FAILED)
     expected_entry = 'successful entry'
-    entry_response_mock2 = mocker.MagicMock(
-        text_body=expected_entry, status=r.KEGGresponse.Status.SUCCESS, kegg_url=mocker.MagicMock(entry_ids=[success_entry_id]))
-    entry_response_mock3 = mocker.MagicMock(status=r.KEGGresponse.Status.TIMEOUT)
+    entry_response_mock2 = types.SimpleNamespace(
+        text_body=expected_entry, status=r.KEGGresponse.Status.SUCCESS, kegg_url=types.SimpleNamespace(entry_ids=[success_entry_id]))
+    entry_response_mock3 = types.SimpleNamespace(status=r.KEGGresponse.Status.TIMEOUT)
     get_mock: mocker.MagicMock = mocker.patch(
         'kegg_pull.pull.r.KEGGrest.get',
         side_effect=[initial_response_mock, entry_response_mock1, entry_response_mock2, entry_response_mock3])
@@ -148,19 +136,16 @@ def test_pull_separate_entries(mocker, output_dir: str):
 
 
 @pt.fixture(name='file_name', params=['single-entry-id.image', None])
-def remove_file(request):
-    file_name = request.param
-    yield file_name
-    if file_name is not None and os.path.isfile(file_name):
-        os.remove(file_name)
+def get_file_name(request, in_tmp_path):
+    yield request.param
 
 
 @pt.mark.parametrize('status', [r.KEGGresponse.Status.SUCCESS, r.KEGGresponse.Status.FAILED])
 def test_single_entry(mocker, file_name: str, status: r.KEGGresponse.Status):
     single_entry_id = 'single-entry-id'
     binary_body_mock = b'binary body mock'
-    kegg_response_mock = mocker.MagicMock(
-        kegg_url=mocker.MagicMock(entry_ids=[single_entry_id], multiple_entry_ids=False), binary_body=binary_body_mock, status=status)
+    kegg_response_mock = types.SimpleNamespace(
+        kegg_url=types.SimpleNamespace(entry_ids=[single_entry_id], multiple_entry_ids=False), binary_body=binary_body_mock, status=status)
     mocker.patch('kegg_pull.rest.KEGGrest.get', return_value=kegg_response_mock)
     single_pull = p.SinglePull()
     kegg_entry_mapping: p.KEGGentryMapping | None = None
@@ -184,11 +169,8 @@ def test_single_entry(mocker, file_name: str, status: r.KEGGresponse.Status):
 
 
 @pt.fixture(name='entry_field', params=['mol', 'ntseq'])
-def remove_entries(request):
-    entry_field = request.param
-    yield entry_field
-    os.remove(f'entry-id1.{entry_field}')
-    os.remove(f'entry-id2.{entry_field}')
+def get_entry_field(request, in_tmp_path):
+    yield request.param
 
 
 def test_not_all_requested_entries(mocker, entry_field: str):
@@ -196,13 +178,14 @@ def test_not_all_requested_entries(mocker, entry_field: str):
     entry_id2 = 'entry-id2'
     separate_text_body1 = 'separate text body 1'
     separate_text_body2 = 'separate text body 2'
-    initial_kegg_response_mock = mocker.MagicMock(
-        status=r.KEGGresponse.Status.SUCCESS, text_body=separate_text_body1, kegg_url=mocker.MagicMock(entry_ids=[entry_id1, entry_id2]))
-    separate_response_mock1 = mocker.MagicMock(
+    initial_kegg_response_mock = types.SimpleNamespace(
+        status=r.KEGGresponse.Status.SUCCESS, text_body=separate_text_body1,
+        kegg_url=types.SimpleNamespace(entry_ids=[entry_id1, entry_id2]))
+    separate_response_mock1 = types.SimpleNamespace(
         status=r.KEGGresponse.Status.SUCCESS, text_body=separate_text_body1,
-        kegg_url=mocker.MagicMock(entry_ids=[entry_id1]))
-    separate_response_mock2 = mocker.MagicMock(
-        status=r.KEGGresponse.Status.SUCCESS, text_body=separate_text_body2, kegg_url=mocker.MagicMock(entry_ids=[entry_id2]))
+        kegg_url=types.SimpleNamespace(entry_ids=[entry_id1]))
+    separate_response_mock2 = types.SimpleNamespace(
+        status=r.KEGGresponse.Status.SUCCESS, text_body=separate_text_body2, kegg_url=types.SimpleNamespace(entry_ids=[entry_id2]))
     get_mock: mocker.MagicMock = mocker.patch(
         'kegg_pull.pull.r.KEGGrest.get', side_effect=[separate_response_mock1, separate_response_mock2])
     u.mock_non_instantiable(mocker=mocker)
@@ -230,22 +213,16 @@ def get_multiple_pull_output(request):
     yield output
 
 
-@pt.fixture(name='_')
-def remove_aborted_pull_results():
-    yield
-    if os.path.isfile(p.AbstractMultiplePull.ABORTED_PULL_RESULTS_PATH):
-        os.remove(p.AbstractMultiplePull.ABORTED_PULL_RESULTS_PATH)
-
-
 test_multiple_pull_data = [
     (p.SingleProcessMultiplePull, {}), (p.MultiProcessMultiplePull, {'n_workers': 2}),
     (p.MultiProcessMultiplePull, {'n_workers': None}), (p.MultiProcessMultiplePull, {'unsuccessful_threshold': 0.01})]
 
 
+@pt.mark.usefixtures('in_tmp_path')
 @pt.mark.parametrize('MultiplePull,kwargs', test_multiple_pull_data)
 def test_multiple_pull(
         mocker, MultiplePull: type[p.MultiProcessMultiplePull | p.SingleProcessMultiplePull], kwargs: dict,
-        multiple_pull_output: str | None, caplog, _):
+        multiple_pull_output: str | None, caplog):
     expected_pull_calls = [
         ['A0', 'A1', 'A2', 'A3', 'A4', 'A5', 'A6', 'A7', 'A8', 'A9'], ['B0', 'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B9'],
         ['C0', 'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'C9'], ['D0', 'D1']]
@@ -6,8 +6,8 @@ import kegg_pull.pull_cli as p_cli
 import dev.utils as u
 
 
-def test_help(mocker):
-    u.assert_help(mocker=mocker, module=p_cli, subcommand='pull')
+def test_help(mocker, capsys):
+    u.assert_help(mocker=mocker, capsys=capsys, module=p_cli, subcommand='pull')
 
 
 @pt.fixture(name='_')
@@ -45,11 +45,37 @@ test_data = [
     (['entry-ids', '-', '--ut=0.4'], {'n_tries': None, 'time_out': None, 'sleep_time': None},
      'u.parse_input_sequence', {'input_source': '-'}, 'SingleProcessMultiplePull', {'unsuccessful_threshold': 0.4},
      {'output': '.', 'force_single_entry': False, 'entry_field': None}, False, None)]
+test_data_ids = [' '.join(args) for args, *_ in test_data]
+
+
+expected_pull_results = {
+    'percent-success': 66.67, 'pull-minutes': 1.13, 'num-successful': 4, 'num-failed': 2, 'num-timed-out': 0, 'num-total': 6,
+    'successful-entry-ids': ['a', 'b', 'c', 'x'], 'failed-entry-ids': ['y', 'z'], 'timed-out-entry-ids': []}
+expected_pull_results_text: str = '\n'.join([
+    '{',
+    '"percent-success": 66.67,',
+    '"pull-minutes": 1.13,',
+    '"num-successful": 4,',
+    '"num-failed": 2,',
+    '"num-timed-out": 0,',
+    '"num-total": 6,',
+    '"successful-entry-ids": [',
+    '"a",',
+    '"b",',
+    '"c",',
+    '"x"',
+    '],',
+    '"failed-entry-ids": [',
+    '"y",',
+    '"z"',
+    '],',
+    '"timed-out-entry-ids": []',
+    '}'])
 
 
 @pt.mark.parametrize(
     'args,kegg_rest_kwargs,entry_ids_method,entry_ids_kwargs,multiple_pull_class,multiple_pull_kwargs,pull_kwargs,print_to_screen,separator',
-    test_data)
+    test_data, ids=test_data_ids)
 def test_main(
         mocker, _, args: list, kegg_rest_kwargs: dict, entry_ids_method: str, entry_ids_kwargs: dict, multiple_pull_class: str,
         multiple_pull_kwargs: dict, pull_kwargs: dict, print_to_screen: bool, separator: str | None, caplog):
@@ -87,32 +113,9 @@ def test_main(
     else:
         multiple_pull_mock.pull.assert_called_once_with(entry_ids=entry_ids_mock, **pull_kwargs)
     entry_ids_method_mock.assert_called_with(**entry_ids_kwargs)
-    expected_pull_results = {
-        'percent-success': 66.67, 'pull-minutes': 1.13, 'num-successful': 4, 'num-failed': 2, 'num-timed-out': 0, 'num-total': 6,
-        'successful-entry-ids': ['a', 'b', 'c', 'x'], 'failed-entry-ids': ['y', 'z'], 'timed-out-entry-ids': []}
     with open('pull-results.json', 'r') as file:
         actual_pull_results: dict = json.load(file)
     assert actual_pull_results == expected_pull_results
-    expected_pull_results_text: str = '\n'.join([
-        '{',
-        '"percent-success": 66.67,',
-        '"pull-minutes": 1.13,',
-        '"num-successful": 4,',
-        '"num-failed": 2,',
-        '"num-timed-out": 0,',
-        '"num-total": 6,',
-        '"successful-entry-ids": [',
-        '"a",',
-        '"b",',
-        '"c",',
-        '"x"',
-        '],',
-        '"failed-entry-ids": [',
-        '"y",',
-        '"z"',
-        '],',
-        '"timed-out-entry-ids": []',
-        '}'])
     with open('pull-results.json', 'r') as file:
         actual_pull_results_text: str = file.read()
     assert expected_pull_results_text == actual_pull_results_text
@@ -7,8 +7,8 @@ import kegg_pull.kegg_url as ku
 import dev.utils as u
 
 
-def test_help(mocker):
-    u.assert_help(mocker=mocker, module=r_cli, subcommand='rest')
+def test_help(mocker, capsys):
+    u.assert_help(mocker=mocker, capsys=capsys, module=r_cli, subcommand='rest')
 
 
 test_exception_data = [
@@ -68,13 +68,14 @@ test_data = [
     ('rest_cli.r.KEGGrest.entries_conv', test_args[17], test_kwargs[11], False, 'eid1\neid2'),
     ('rest_cli.r.KEGGrest.entries_link', test_args[18], test_kwargs[13], False, '\nx\n y \n'),
     ('rest_cli.r.KEGGrest.ddi', test_args[19], test_kwargs[14], False, '\t\n\t\tde1\nde2\nde3\n\n  \n  ')]
+test_data_ids = [' '.join(args) for _, args, *_ in test_data]
 
 
-@pt.mark.parametrize('rest_method,args,kwargs,is_binary,stdin_mock', test_data)
-def test_print(mocker, rest_method: str, args: list, kwargs: dict, is_binary: bool, stdin_mock: str, caplog):
+@pt.mark.parametrize('rest_method,args,kwargs,is_binary,stdin_mock', test_data, ids=test_data_ids)
+def test_print(mocker, capsys, rest_method: str, args: list, kwargs: dict, is_binary: bool, stdin_mock: str, caplog):
     kegg_response_mock, expected_output = _get_kegg_response_mock_and_expected_output(mocker=mocker, is_binary=is_binary)
     u.test_print(
-        mocker=mocker, argv_mock=args, stdin_mock=stdin_mock, method=rest_method, method_return_value=kegg_response_mock,
+        mocker=mocker, capsys=capsys, argv_mock=args, stdin_mock=stdin_mock, method=rest_method, method_return_value=kegg_response_mock,
         method_kwargs=kwargs, module=r_cli, expected_output=expected_output, is_binary=is_binary, caplog=caplog)
 
 
@@ -88,7 +89,7 @@ def _get_kegg_response_mock_and_expected_output(mocker, is_binary: bool) -> tupl
     return kegg_response_mock, expected_output
 
 
-@pt.mark.parametrize('rest_method,args,kwargs,is_binary,stdin_mock', test_data)
+@pt.mark.parametrize('rest_method,args,kwargs,is_binary,stdin_mock', test_data, ids=test_data_ids)
 def test_file(mocker, rest_method: str, args: list, kwargs: dict, is_binary: bool, output_file: str, stdin_mock: str):
     kegg_response_mock, expected_output = _get_kegg_response_mock_and_expected_output(mocker=mocker, is_binary=is_binary)
     u.test_file(
@@ -131,7 +132,7 @@ def test_test(mocker, KEGGurl: type[ku.AbstractKEGGurl], args: list, kwargs: dic
     print_mock.assert_called_once_with(test_result)
 
 
-@pt.mark.parametrize('rest_method,args,kwargs,is_binary,stdin_mock', test_data)
+@pt.mark.parametrize('rest_method,args,kwargs,is_binary,stdin_mock', test_data, ids=test_data_ids)
 def test_zip_archive(mocker, rest_method: str, args: list, kwargs: dict, is_binary: bool, zip_archive_data: tuple, stdin_mock: str):
     kegg_response_mock, expected_output = _get_kegg_response_mock_and_expected_output(mocker=mocker, is_binary=is_binary)
     u.test_zip_archive(
@@ -1,5 +1,7 @@
 # noinspection PyPackageRequirements
 import pytest as pt
+import sys
+import io
 # noinspection PyProtectedMember
 import kegg_pull._utils as utils
 import dev.utils as u
@@ -18,10 +20,9 @@ def test_parse_input_sequence_comma_exception(comma_separated_list: str):
 
 @pt.mark.parametrize('stdin_input', ['', '\n', '\t\t', '\n\n', '\t \n \t', ' \n \n\t\t \t\n'])
 def test_parse_input_sequence_stdin_exception(mocker, stdin_input: str):
-    stdin_mock: mocker.MagicMock = mocker.patch('kegg_pull._utils.sys.stdin.read', return_value=stdin_input)
+    mocker.patch.object(sys, 'stdin', io.StringIO(stdin_input))
     with pt.raises(ValueError) as error:
         utils.parse_input_sequence(input_source='-')
-    stdin_mock.assert_called_once_with()
     expected_message = 'Empty list provided from standard input'
     u.assert_exception(expected_message=expected_message, exception=error)
 
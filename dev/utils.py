@@ -5,6 +5,22 @@ import typing as t
 import json
 import jsonschema as js
 import os
+import sys
+import io
+import functools as ft
+import unittest.mock as mock
+
+# A mapping and the JSON string it is saved or printed as, shared by the map and map CLI tests
+mapping_mock = {'k1': {'v1'}, 'k2': {'v1', 'v2'}, 'k3': {'v3', 'v4'}}
+mapping_json_mock = '{\n  "k1": [\n    "v1"\n  ],\n  "k2": [\n    "v1",\n    "v2"\n  ],\n  "k3": [\n    "v3",\n    "v4"\n  ]\n}'
+
+test_data_dir: str = os.path.join(os.path.dirname(__file__), 'test_data')
+
+
+@ft.cache
+def read_test_data(file_path: str) -> str:
+    with open(os.path.join(test_data_dir, file_path), 'r') as file:
+        return file.read()
 
 
 def assert_exception(expected_message: str, exception: pt.ExceptionInfo):
@@ -24,45 +40,39 @@ def assert_error(message: str, caplog):
     assert record.message == message
 
 
-def assert_help(mocker, module, subcommand: str):
+def assert_help(mocker, capsys, module, subcommand: str):
+    expected_help: str = module.__doc__.strip('\n')
     for help_arg in ['-h', '--help']:
-        mocker.patch('sys.argv', ['kegg_pull', subcommand, help_arg])
-        print_mock: mocker.MagicMock = mocker.patch('builtins.print')
+        mocker.patch.object(sys, 'argv', ['kegg_pull', subcommand, help_arg])
         with pt.raises(SystemExit):
             module.main()
-        print_mock.assert_any_call(module.__doc__.strip('\n'))
-    
+        assert capsys.readouterr().out == f'{expected_help}\n'
+
 
 def assert_call_args(function_mock, expected_call_args_list: list, do_kwargs: bool):
-    actual_call_args_list = function_mock.call_args_list
-    for actual_call_args, expected_call_args in zip(actual_call_args_list, expected_call_args_list):
-        if do_kwargs:
-            assert actual_call_args.kwargs == expected_call_args
-        else:
-            assert actual_call_args.args == expected_call_args
+    expected_calls = [mock.call(**call_args) if do_kwargs else mock.call(*call_args) for call_args in expected_call_args_list]
+    assert function_mock.call_args_list == expected_calls
 
 
 def _test_main(mocker, argv_mock: list, stdin_mock: str, method: str, method_return_value: object, method_kwargs: dict, module):
     argv_mock: list = ['kegg_pull'] + argv_mock
-    mocker.patch('sys.argv', argv_mock)
-    stdin_mock: mocker.MagicMock = mocker.patch('kegg_pull._utils.sys.stdin.read', return_value=stdin_mock) if stdin_mock else None
+    mocker.patch.object(sys, 'argv', argv_mock)
+    if stdin_mock:
+        mocker.patch.object(sys, 'stdin', io.StringIO(stdin_mock))
     method_mock: mocker.MagicMock = mocker.patch(f'kegg_pull.{method}', return_value=method_return_value)
     module.main()
     method_mock.assert_called_once_with(**method_kwargs)
-    if stdin_mock:
-        stdin_mock.assert_called_once_with()
 
 
 def test_print(
-        mocker, argv_mock: list, stdin_mock: str, method: str, method_return_value: object, method_kwargs: dict, module,
+        mocker, capsys, argv_mock: list, stdin_mock: str, method: str, method_return_value: object, method_kwargs: dict, module,
         expected_output: str | bytes, is_binary: bool = False, caplog=None):
-    print_mock: mocker.MagicMock = mocker.patch('builtins.print')
     _test_main(
         mocker=mocker, argv_mock=argv_mock, stdin_mock=stdin_mock, method=method, method_return_value=method_return_value,
         method_kwargs=method_kwargs, module=module)
     if is_binary:
         assert_warning(message='Printing binary output...', caplog=caplog)
-    print_mock.assert_called_once_with(expected_output)
+    assert capsys.readouterr().out == f'{expected_output}\n'
 
 
 def test_file(
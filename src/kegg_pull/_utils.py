@@ -1,3 +1,4 @@
+from __future__ import annotations
 import logging as log
 import typing as t
 import zipfile as zf
@@ -38,7 +39,13 @@ def _get_range_values(
             f'{", ".join(range_value for range_value in range_values)}')
 
 
-def load_json_file(file_path: str, json_schema: dict, validation_error_message: str) -> dict:
+def get_json_validator(json_schema: dict) -> js.protocols.Validator:
+    validator_class: type[js.protocols.Validator] = js.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema)
+
+
+def load_json_file(file_path: str, json_validator: js.protocols.Validator, validation_error_message: str) -> dict:
     if '.zip:' in file_path:
         [file_location, file_name] = file_path.split('.zip:')
         file_location = file_location + '.zip'
@@ -48,16 +55,16 @@ def load_json_file(file_path: str, json_schema: dict, validation_error_message:
     else:
         with open(file_path, 'r') as file:
             json_object: dict = json.load(file)
-    validate_json_object(json_object=json_object, json_schema=json_schema, validation_error_message=validation_error_message)
+    validate_json_object(json_object=json_object, json_validator=json_validator, validation_error_message=validation_error_message)
     return json_object
 
 
-def validate_json_object(json_object: dict, json_schema: dict, validation_error_message: str) -> None:
-    try:
-        js.validate(json_object, json_schema)
-    except js.exceptions.ValidationError as e:
+def validate_json_object(json_object: dict, json_validator: js.protocols.Validator, validation_error_message: str) -> None:
+    # Raises the most relevant of the validation errors, if any
+    error: js.exceptions.ValidationError | None = js.exceptions.best_match(json_validator.iter_errors(json_object))
+    if error is not None:
         log.error(validation_error_message)
-        raise e
+        raise error
 
 
 def parse_input_sequence(input_source: str) -> list[str]:
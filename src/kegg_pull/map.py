@@ -5,7 +5,6 @@ Constructing Mappings From KEGG "link" And "conv" Operations
 """
 import typing as t
 import json
-import copy as cp
 import logging as log
 from . import rest as r
 from . import kegg_url as ku
@@ -57,7 +56,7 @@ def _to_dict(kegg_rest: r.KEGGrest | None, KEGGurl: type[ku.AbstractKEGGurl], **
     if text_body:
         for one_to_one in text_body.split('\n'):
             [map_from_id, map_to_id] = one_to_one.strip().split('\t')
-            _add_to_dict(dictionary=mapped_ids, key=map_from_id, values={map_to_id})
+            mapped_ids.setdefault(map_from_id, set()).add(map_to_id)
     return mapped_ids
 
 
@@ -71,7 +70,7 @@ def _add_to_dict(dictionary: KEGGmapping, key: str, values: set[str]) -> None:
     if key in dictionary.keys():
         dictionary[key].update(values)
     else:
-        dictionary[key] = cp.deepcopy(values)  # In case "values" is referenced elsewhere, we don't want to update a shallow copy
+        dictionary[key] = set(values)  # In case "values" is referenced elsewhere, we don't want to update a shallow copy
 
 
 def _deduplicate_pathway_ids(mapping: KEGGmapping, deduplicate: bool, source_database: str, target_database: str) -> KEGGmapping:
@@ -274,9 +273,7 @@ def combine_mappings(mapping1: KEGGmapping, mapping2: KEGGmapping) -> KEGGmappin
     :param mapping2: The second mapping to combine.
     :return: The combined mapping.
     """
-    combined = dict()
-    for key1, values1 in mapping1.items():
-        _add_to_dict(dictionary=combined, key=key1, values=values1)
+    combined = {key1: set(values1) for key1, values1 in mapping1.items()}
     for key2, values2 in mapping2.items():
         _add_to_dict(dictionary=combined, key=key2, values=values2)
     return combined
@@ -291,7 +288,7 @@ def reverse(mapping: KEGGmapping) -> KEGGmapping:
     reversed_mapping = dict()
     for key, values in mapping.items():
         for value in values:
-            _add_to_dict(dictionary=reversed_mapping, key=value, values={key})
+            reversed_mapping.setdefault(value, set()).add(key)
     return reversed_mapping
 
 
@@ -310,6 +307,7 @@ _mapping_schema = {
         }
     }
 }
+_mapping_validator = u.get_json_validator(json_schema=_mapping_schema)
 _validation_error_message = 'The mapping must be a dictionary of entry IDs (strings) mapped to a set of entry IDs'
 
 
@@ -324,7 +322,7 @@ def to_json_string(mapping: KEGGmapping) -> str:
     for entry_id, entry_ids in mapping.items():
         mapping_to_convert[entry_id] = sorted(entry_ids)
     u.validate_json_object(
-        json_object=mapping_to_convert, json_schema=_mapping_schema, validation_error_message=_validation_error_message)
+        json_object=mapping_to_convert, json_validator=_mapping_validator, validation_error_message=_validation_error_message)
     return json.dumps(mapping_to_convert, indent=2)
 
 
@@ -348,7 +346,7 @@ def load_from_json(file_path: str) -> KEGGmapping:
     :return: The mapping.
     :raises ValidationError: Raised if the mapping does not follow the correct JSON schema. Should follow the correct schema if the dictionary was created with this map module.
     """
-    mapping: KEGGmapping = u.load_json_file(file_path=file_path, json_schema=_mapping_schema, validation_error_message=_validation_error_message)
+    mapping: KEGGmapping = u.load_json_file(file_path=file_path, json_validator=_mapping_validator, validation_error_message=_validation_error_message)
     for entry_id, entry_ids in mapping.items():
         mapping[entry_id] = set(entry_ids)
     return mapping
@@ -174,6 +174,7 @@ class PathwayOrganizer(u.NonInstantiable):
             }
         }
     }
+    _validator = u.get_json_validator(json_schema=_schema)
 
     @staticmethod
     def load_from_json(file_path: str) -> PathwayOrganizer:
@@ -185,7 +186,7 @@ class PathwayOrganizer(u.NonInstantiable):
         """
         pathway_org = PathwayOrganizer()
         hierarchy_nodes: HierarchyNodes = u.load_json_file(
-            file_path=file_path, json_schema=PathwayOrganizer._schema,
+            file_path=file_path, json_validator=PathwayOrganizer._validator,
             validation_error_message=f'Failed to load the hierarchy nodes. The pathway organizer JSON file at {file_path} is '
                                      f'corrupted and will need to be re-created.')
         pathway_org.hierarchy_nodes = hierarchy_nodes